@@ -1,6 +1,7 @@
 """Application configuration using pydantic-settings."""
 from functools import lru_cache
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 
 
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
     # Security
     api_key_header: str = "X-API-Key"
     api_keys: list[str] = []
+    _api_keys_cache: tuple[list[str], frozenset[str]] | None = PrivateAttr(default=None)
 
     # CORS
     allowed_origins: list[str] = ["*"]
@@ -31,9 +33,17 @@ class Settings(BaseSettings):
     }
 
     @property
-    def api_keys_set(self) -> set[str]:
-        """Convert API keys to set for O(1) lookup."""
-        return set(self.api_keys)
+    def api_keys_set(self) -> frozenset[str]:
+        """Convert API keys to a set for O(1) lookup, cached per ``api_keys`` list.
+
+        The set is rebuilt whenever ``api_keys`` is replaced (reassignment or
+        ``model_copy(update=...)``); mutating the list in place is not detected.
+        """
+        cache = self._api_keys_cache
+        if cache is None or cache[0] is not self.api_keys:
+            cache = (self.api_keys, frozenset(self.api_keys))
+            self._api_keys_cache = cache
+        return cache[1]
 
 
 @lru_cache
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List
 from sqlmodel import SQLModel, Field , create_engine, Session, select
+from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 from database import create_db_and_tables
 import os
@@ -9,13 +11,21 @@ import os
 load_dotenv()
 
 # Database setup
-engine = create_engine(os.getenv("DATABASE_URL"),echo=True)
+# echo logs every SQL statement, so only turn it on when DEBUG is set
+engine = create_engine(
+    os.getenv("DATABASE_URL"),
+    echo=os.getenv("DEBUG", "false").lower() == "true",
+    pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_recycle=3600,
+)
 
 # FastAPI application setup
 app = FastAPI(
     title="Todo API",
     description="A simple Todo API with CRUD operations and error handling",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 #DB Structure and Model/Tables + same used at API
 class Task(SQLModel, table=True):
@@ -29,8 +39,11 @@ class Task(SQLModel, table=True):
 #     print("Creating database and tables...")
 #     SQLModel.metadata.create_all(engine)
 #     print("Database and tables created.")
+# expire_on_commit=False keeps objects loaded after commit, so no refresh SELECT is needed
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False, autoflush=False)
+
 def get_session():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
 # how to create the database tables
 # create_db_and_tables
@@ -38,20 +51,23 @@ def get_session():
 def create_task(task: Task, session: Session = Depends(get_session)):
     session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
-@app.get("/tasks")
+# read endpoints skip jsonable_encoder and hand the row dicts straight to orjson
+# (plain column rows, so no ORM objects or identity map entries are created)
+task_columns = Task.__table__.columns
+
+@app.get("/tasks", responses={200: {"model": List[Task]}})
 def read_tasks(session: Session = Depends(get_session)):
-    task = session.exec(select(Task)).all()
-    return task
+    task = session.exec(select(*task_columns)).mappings().all()
+    return ORJSONResponse([dict(t) for t in task])
 
-@app.get("/tasks/{task_id}")
+@app.get("/tasks/{task_id}", responses={200: {"model": Task}})
 def read_task(task_id: int, session: Session = Depends(get_session)):
-    task = session.get(Task, task_id)
+    task = session.exec(select(*task_columns).where(Task.id == task_id)).mappings().first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return ORJSONResponse(dict(task))
 
 @app.update("/tasks/{task_id}")
 def update_task(task_id: int, updated_task: Task, session: Session = Depends(get_session)):
@@ -63,7 +79,6 @@ def update_task(task_id: int, updated_task: Task, session: Session = Depends(get
     task.completed = updated_task.completed
     session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
 # ## Pydantic model for Todo item
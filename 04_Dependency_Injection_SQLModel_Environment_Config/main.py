@@ -20,4 +20,5 @@ async def read_root(config: dict = Depends(get_config)):
 
 if __name__ == "__main__":
     import uvicorn
+    # uvicorn picks uvloop/httptools automatically when uvicorn[standard] installed them
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
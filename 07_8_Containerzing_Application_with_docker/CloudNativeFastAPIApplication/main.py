@@ -1,4 +1,4 @@
-import time
+import asyncio
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware import Middleware
@@ -21,7 +21,7 @@ async def middleware_one(request: Request, call_next) -> Response:
     """Add processing time to every response."""
 
     print("Middleware One: Before processing request")
-    time.sleep(1)  
+    await asyncio.sleep(1)  # non-blocking, so other requests keep being served
     response = await call_next(request)  # Pass to route
     print("Middleware One: After processing request")
     return response
@@ -30,7 +30,7 @@ async def middleware_one(request: Request, call_next) -> Response:
 async def middleware_two(request: Request, call_next) -> Response:
     """Simulate a delay in processing."""
     print("Middleware Two: Before processing request")
-    time.sleep(1)  # Simulate delay
+    await asyncio.sleep(1)  # Simulate delay without blocking the event loop
     response = await call_next(request)  # Pass to route
     print("Middleware Two: After processing request")
     return response
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI(
@@ -22,48 +22,49 @@ def read_root():
     return {"message": "The Container Application is running!"}
 
 # creating todo application with in memory storage
-todos = [
-    {"id": 1, "task": "Buy groceries"},
-    {"id": 2, "task": "Walk the dog"},
-    {"id": 3, "task": "Read a book"},
-    {"id": 4, "task": "Write code"},
-    {"id": 5, "task": "Go to the gym"},
-    {"id": 6, "task": "Cook dinner"},
-] 
+# keyed by id so lookups/updates/deletes are O(1) instead of scanning a list
+todos: dict[int, dict] = {
+    1: {"id": 1, "task": "Buy groceries"},
+    2: {"id": 2, "task": "Walk the dog"},
+    3: {"id": 3, "task": "Read a book"},
+    4: {"id": 4, "task": "Write code"},
+    5: {"id": 5, "task": "Go to the gym"},
+    6: {"id": 6, "task": "Cook dinner"},
+}
+_next_id = max(todos, default=0) + 1
 
 #get all todos
 @app.get("/todos")
 def get_todos():
-    return {"todos": todos}
+    return {"todos": list(todos.values())}
 
 #get a todo by id
 @app.get("/todos/{todo_id}")
 def get_todo(todo_id: int):
-    for todo in todos:
-        if todo["id"] == todo_id:
-            return {"todo": todo}
-    return {"error": "Todo not found"}, 404
+    todo = todos.get(todo_id)
+    if todo is not None:
+        return {"todo": todo}
+    raise HTTPException(status_code=404, detail="Todo not found")
 #create a new todo
 @app.post("/todos")
 def create_todo(task: str):
-    new_id = max((todo["id"] for todo in todos), default=0) + 1
-    new_todo = {"id": new_id, "task": task}
-    todos.append(new_todo)
+    global _next_id
+    new_todo = {"id": _next_id, "task": task}
+    todos[_next_id] = new_todo
+    _next_id += 1
     return {"todo": new_todo}
 #update a todo
 @app.put("/todos/{todo_id}")
 def update_todo(todo_id: int, task: str):
-    for todo in todos:
-        if todo["id"] == todo_id:
-            todo["task"] = task
-            return {"todo": todo}
-    return {"error": "Todo not found"}, 404
+    todo = todos.get(todo_id)
+    if todo is not None:
+        todo["task"] = task
+        return {"todo": todo}
+    raise HTTPException(status_code=404, detail="Todo not found")
 #delete a todo
 @app.delete("/todos/{todo_id}")
 def delete_todo(todo_id: int):
-    for todo in todos:
-        if todo["id"] == todo_id:
-            todos.remove(todo)
-            return {"message": "Todo deleted"}
-    return {"error": "Todo not found"}, 404
+    if todos.pop(todo_id, None) is not None:
+        return {"message": "Todo deleted"}
+    raise HTTPException(status_code=404, detail="Todo not found")
 
@@ -11,11 +11,15 @@ engine = create_engine(
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
+    query_cache_size=1200,
 )
 
+# expire_on_commit=False keeps returned objects loaded after commit, so CRUD
+# methods don't need a refresh SELECT before handing them back.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
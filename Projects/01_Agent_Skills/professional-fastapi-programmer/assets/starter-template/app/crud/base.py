@@ -2,7 +2,7 @@
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, insert, inspect, lambda_stmt, select, update
 from sqlalchemy.orm import Session
 
 from app.models.base import Base
@@ -16,6 +16,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base class for CRUD operations.
 
     Provides generic Create, Read, Update, Delete operations for SQLAlchemy models.
+    Read queries are built with ``lambda_stmt`` so their construction and SQL
+    compilation are cached once per process instead of redone per request.
     """
 
     def __init__(self, model: type[ModelType]):
@@ -34,21 +36,65 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         limit: int = 100,
     ) -> list[ModelType]:
         """Get multiple records with pagination."""
-        stmt = select(self.model).offset(skip).limit(limit)
-        return list(db.scalars(stmt).all())
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        stmt += lambda s: s.offset(skip).limit(limit)
+        return list(db.scalars(stmt))
+
+    def get_multi_core(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Row[Any]]:
+        """Get multiple records as plain column rows with pagination.
+
+        Skips ORM object construction and the identity map, for read-only
+        endpoints that only serialize the result.
+        """
+        table = self.model.__table__
+        stmt = lambda_stmt(lambda: select(*table.columns))
+        stmt += lambda s: s.offset(skip).limit(limit)
+        return list(db.execute(stmt))
 
     def count(self, db: Session) -> int:
         """Get total count of records."""
-        stmt = select(func.count()).select_from(self.model)
+        model = self.model
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(model))
         return db.scalar(stmt) or 0
 
+    def get_multi_with_count(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ModelType], int]:
+        """Get a page of records and the total count in a single query.
+
+        Uses a ``COUNT(*) OVER()`` window so paginated endpoints don't need a
+        separate ``count`` round trip.
+        """
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model, func.count().over().label("total")))
+        stmt += lambda s: s.offset(skip).limit(limit)
+        rows = db.execute(stmt).all()
+        if not rows:
+            # Past the last page the window has no rows to report the total on.
+            return [], self.count(db) if skip else 0
+        return [row[0] for row in rows], rows[0].total
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record."""
+        """Create a new record.
+
+        Uses ``INSERT ... RETURNING`` so generated columns come back with the
+        insert itself instead of a follow-up ``refresh`` SELECT.
+        """
         obj_data = obj_in.model_dump()
-        db_obj = self.model(**obj_data)
-        db.add(db_obj)
+        stmt = insert(self.model).values(**obj_data).returning(self.model)
+        db_obj = db.scalars(stmt).one()
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def update(
@@ -58,15 +104,31 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: UpdateSchemaType | dict[str, Any],
     ) -> ModelType:
-        """Update an existing record."""
+        """Update an existing record.
+
+        Uses ``UPDATE ... RETURNING`` so the stored row comes back with the
+        update itself instead of a follow-up ``refresh`` SELECT.
+
+        Raises:
+            ValueError: If ``db_obj`` is transient or pending (has no identity yet).
+        """
         obj_data = (
             obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
         )
-        for field, value in obj_data.items():
-            setattr(db_obj, field, value)
-        db.add(db_obj)
+        if not obj_data:
+            return db_obj
+        identity = inspect(db_obj).identity
+        if identity is None:
+            raise ValueError(f"Cannot update a {self.model.__name__} that has not been persisted")
+        primary_key = zip(inspect(self.model).primary_key, identity, strict=True)
+        stmt = (
+            update(self.model)
+            .where(*(column == value for column, value in primary_key))
+            .values(**obj_data)
+            .returning(self.model)
+        )
+        db_obj = db.scalars(stmt).one()
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def delete(self, db: Session, *, id: int) -> ModelType | None:
@@ -7,6 +7,13 @@ class Settings(BaseSettings):
     debug: bool = False
     max_tasks_per_user: int = 100
 
+    # Database
+    database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    # Recycle pooled connections before Neon drops them as idle
+    db_pool_recycle: int = 300
+
     class Config:
         env_file = ".env"
 
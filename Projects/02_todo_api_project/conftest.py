@@ -0,0 +1,125 @@
+import os
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+from sqlmodel import SQLModel, Session, create_engine
+
+# Settings require a DATABASE_URL at import time; the fixtures below swap in
+# their own engine, so this database is never connected to.
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the app once for the whole test run."""
+    import main
+
+    return main.app
+
+
+@pytest.fixture(scope="session")
+def engine(app):
+    """Create the in-memory SQLite database and its tables once per test run.
+
+    Under pytest-xdist each worker is its own process, so each gets a private
+    database.
+    """
+    # Every :memory: connection is its own empty database; StaticPool hands the
+    # same connection to every checkout so all sessions see the created tables.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _fast_sqlite(dbapi_connection, connection_record):
+        # Test data is throwaway: skip fsyncs and keep journals/temp tables in RAM
+        cursor = dbapi_connection.cursor()
+        cursor.executescript(
+            "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;"
+        )
+        cursor.close()
+        # pysqlite's own transaction handling breaks SAVEPOINTs; turn it off
+        # and let SQLAlchemy emit BEGIN itself (see the SQLAlchemy SQLite docs)
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Fresh empty database: run DDL compiled once from the models the app
+    # registered, instead of create_all re-walking the metadata and checking
+    # for existing tables first. executescript sends it to SQLite in one call.
+    create_sql = ";\n".join(
+        str(CreateTable(table).compile(dialect=sqlite.dialect())).strip()
+        for table in SQLModel.metadata.sorted_tables
+    )
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(create_sql)
+    finally:
+        raw.close()
+    yield engine
+    # Rows are rolled back per test, so there is nothing left to drop; closing
+    # the connection discards the in-memory database without any DDL.
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def connection(engine):
+    """One connection for the whole run, inside a transaction that is never committed."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(app, connection):
+    """Run the app's sessions inside a per-test SAVEPOINT."""
+    from database import get_session
+
+    savepoint = connection.begin_nested()
+
+    # The handlers' commits only release inner SAVEPOINTs the session creates,
+    # so everything stays inside this test's savepoint.
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+        autoflush=False,
+    )
+    app.dependency_overrides[get_session] = lambda: session
+
+    yield session
+
+    # Teardown: roll back to the savepoint, discarding everything the test wrote
+    app.dependency_overrides.clear()
+    session.close()
+    savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _client(app):
+    """Create one AsyncClient for the whole module.
+
+    ASGITransport calls the app directly on the event loop, without
+    TestClient's thread portal. It does not run the lifespan, so the startup
+    create_db_and_tables() pass is skipped; the schema already exists.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def client(_client, db_session):
+    """The shared client, with this test's session injected into the app."""
+    return _client
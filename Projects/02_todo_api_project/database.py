@@ -1,11 +1,25 @@
-from fastapi import logger
+import logging
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, create_engine, Session
 from config import get_settings
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
-logger.info(f"Connecting to database: {get_settings().database_url.split('@')[-1] if '@' in get_settings().database_url else 'local'}")
-engine = create_engine(settings.database_url, echo=True)
-print(f"Using database URL: {settings.database_url}")
+logger.info(f"Connecting to database: {settings.database_url.split('@')[-1] if '@' in settings.database_url else 'local'}")
+# SQL echo logs every statement on the request path, so only enable it in debug
+engine = create_engine(
+    settings.database_url,
+    echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=False,
+    pool_recycle=settings.db_pool_recycle,
+)
+
+# Built once at import; expire_on_commit=False keeps loaded attributes valid
+# after commit so handlers don't need a refresh SELECT to return the object.
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False, autoflush=False)
 
 
 # Create tables
@@ -18,5 +32,5 @@ def create_db_and_tables():
 # Dependency to get database session
 def get_session():
     """Dependency that provides database sessions."""
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session